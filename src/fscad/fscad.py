@@ -69,11 +69,29 @@ _brep_types = Onion[adsk.fusion.BRepBody, adsk.fusion.BRepCell, adsk.fusion.BRep
                     adsk.fusion.BRepVertex, adsk.fusion.BRepWire]
 
 
+# Constant points and vectors that are only ever passed to the API, and never modified.
+_origin = Point3D.create(0, 0, 0)
+_null_vector = Vector3D.create(0, 0, 0)
+_pos_x = Vector3D.create(1, 0, 0)
+_pos_y = Vector3D.create(0, 1, 0)
+_pos_z = Vector3D.create(0, 0, 1)
+
+_app = None
+_design = None
+_root = None
+
+
 def app():
-    return adsk.core.Application.get()
+    # The application object is a singleton, so it's safe to hold on to it indefinitely.
+    global _app
+    if _app is None:
+        _app = adsk.core.Application.get()
+    return _app
 
 
 def root() -> adsk.fusion.Component:
+    if _root is not None:
+        return _root
     return design().rootComponent
 
 
@@ -95,9 +113,23 @@ def brep():
 
 
 def design() -> adsk.fusion.Design:
+    if _design is not None:
+        return _design
     return adsk.fusion.Design.cast(app().activeProduct)
 
 
+def _cache_active_design(active_design: Optional[adsk.fusion.Design]):
+    """Caches the given design and its root component, to be returned by design() and root().
+
+    The cache is only populated while run_design is running the design function. setup_document refreshes it if it
+    switches documents while the cache is populated. Pass None to clear the cache and go back to looking up the active
+    design on each call.
+    """
+    global _design, _root
+    _design = active_design
+    _root = active_design.rootComponent if active_design is not None else None
+
+
 def _collection_of(collection):
     object_collection = ObjectCollection.create()
     for obj in collection:
@@ -107,25 +139,28 @@ def _collection_of(collection):
 
 def _create_component(parent_component, *bodies: Onion[BRepBody, 'Body'], name) -> Occurrence:
     new_occurrence = parent_component.occurrences.addNewComponent(Matrix3D.create())
-    new_occurrence.component.name = name
-    for body in bodies:
-        if isinstance(body, Body):
-            body = body.brep
-        new_occurrence.component.bRepBodies.add(body)
+    new_component = new_occurrence.component
+    new_component.name = name
+    if bodies:
+        component_bodies = new_component.bRepBodies
+        for body in bodies:
+            if isinstance(body, Body):
+                body = body.brep
+            component_bodies.add(body)
     return new_occurrence
 
 
 def _oriented_bounding_box_to_bounding_box(oriented: OrientedBoundingBox3D):
     coordinate_transform = Matrix3D.create()
     coordinate_transform.setToAlignCoordinateSystems(
-        Point3D.create(0, 0, 0),
+        _origin,
         oriented.lengthDirection,
         oriented.widthDirection,
         oriented.heightDirection,
-        Point3D.create(0, 0, 0),
-        Vector3D.create(1, 0, 0),
-        Vector3D.create(0, 1, 0),
-        Vector3D.create(0, 0, 1))
+        _origin,
+        _pos_x,
+        _pos_y,
+        _pos_z)
     center = oriented.centerPoint.copy()
     center.transformBy(coordinate_transform)
 
@@ -142,8 +177,6 @@ def _oriented_bounding_box_to_bounding_box(oriented: OrientedBoundingBox3D):
 
 
 def _get_exact_bounding_box(entity):
-    vector1 = adsk.core.Vector3D.create(1.0, 0.0, 0.0)
-    vector2 = adsk.core.Vector3D.create(0.0, 1.0, 0.0)
 
     if isinstance(entity, Component):
         entities = entity.bodies
@@ -151,12 +184,12 @@ def _get_exact_bounding_box(entity):
         return _get_exact_bounding_box(entities)
 
     if isinstance(entity, BRepEntity):
-        return _get_exact_bounding_box(entity.brep)
+        entity = entity.brep
 
     if hasattr(entity, "objectType"):
         if entity.objectType.startswith("adsk::fusion::BRep"):
             return _oriented_bounding_box_to_bounding_box(
-                app().measureManager.getOrientedBoundingBox(entity, vector1, vector2))
+                app().measureManager.getOrientedBoundingBox(entity, _pos_x, _pos_y))
         else:
             raise TypeError("Cannot get bounding box for type %s" % type(entity).__name__)
 
@@ -355,22 +388,22 @@ def _check_face_coincidence(face1, face2):
         return _check_face_intersection(face1, face2)
 
 
+def _expand_bounding_box(bounding_box: BoundingBox3D, amount: float) -> BoundingBox3D:
+    min_x, min_y, min_z = bounding_box.minPoint.asArray()
+    max_x, max_y, max_z = bounding_box.maxPoint.asArray()
+    return BoundingBox3D.create(
+        Point3D.create(min_x - amount, min_y - amount, min_z - amount),
+        Point3D.create(max_x + amount, max_y + amount, max_z + amount))
+
+
 def _find_coincident_faces_on_body(body: BRepBody, selectors: Iterable[BRepFace]) -> Iterable[BRepFace]:
     coincident_faces = []
     candidate_selectors = []
+    point_tolerance = app().pointTolerance
+    body_bounding_box = body.boundingBox
     for selector in selectors:
-        selector_bounding_box = selector.boundingBox
-        expanded_bounding_box = adsk.core.BoundingBox3D.create(
-            adsk.core.Point3D.create(
-                selector_bounding_box.minPoint.x - app().pointTolerance,
-                selector_bounding_box.minPoint.y - app().pointTolerance,
-                selector_bounding_box.minPoint.z - app().pointTolerance),
-            adsk.core.Point3D.create(
-                selector_bounding_box.maxPoint.x + app().pointTolerance,
-                selector_bounding_box.maxPoint.y + app().pointTolerance,
-                selector_bounding_box.maxPoint.z + app().pointTolerance),
-        )
-        if body.boundingBox.intersects(expanded_bounding_box):
+        expanded_bounding_box = _expand_bounding_box(selector.boundingBox, point_tolerance)
+        if body_bounding_box.intersects(expanded_bounding_box):
             candidate_selectors.append((selector, expanded_bounding_box))
 
     for body_face in body.faces:
@@ -393,19 +426,11 @@ def _find_coincident_edges_on_body(
         body: BRepBody, selectors: Iterable[Onion[BRepFace, BRepEdge]]) -> Iterable[BRepEdge]:
     coincident_edges = []
     candidate_selectors = []
+    point_tolerance = app().pointTolerance
+    body_bounding_box = body.boundingBox
     for selector in selectors:
-        selector_bounding_box = selector.boundingBox
-        expanded_bounding_box = adsk.core.BoundingBox3D.create(
-            adsk.core.Point3D.create(
-                selector_bounding_box.minPoint.x - app().pointTolerance,
-                selector_bounding_box.minPoint.y - app().pointTolerance,
-                selector_bounding_box.minPoint.z - app().pointTolerance),
-            adsk.core.Point3D.create(
-                selector_bounding_box.maxPoint.x + app().pointTolerance,
-                selector_bounding_box.maxPoint.y + app().pointTolerance,
-                selector_bounding_box.maxPoint.z + app().pointTolerance),
-        )
-        if body.boundingBox.intersects(expanded_bounding_box):
+        expanded_bounding_box = _expand_bounding_box(selector.boundingBox, point_tolerance)
+        if body_bounding_box.intersects(expanded_bounding_box):
             candidate_selectors.append((selector, expanded_bounding_box))
 
     for body_edge in body.edges:
@@ -457,7 +482,7 @@ def _project_point_to_line(point: Point3D, line: adsk.core.InfiniteLine3D):
 
 
 def _create_empty_body() -> BRepBody:
-    body1 = brep().createSphere(Point3D.create(0, 0, 0), 1.0)
+    body1 = brep().createSphere(_origin, 1.0)
     body2 = brep().createSphere(Point3D.create(10, 0, 0), 1.0)
     brep().booleanOperation(body1, body2, adsk.fusion.BooleanTypes.IntersectionBooleanType)
     return body1
@@ -507,8 +532,8 @@ def _create_fit_point_spline(*points: Sequence[Onion[Tuple[float, float], Point2
 
     construction_plane_input = temp_occurrence.component.constructionPlanes.createInput(temp_occurrence)
     construction_plane_input.setByPlane(adsk.core.Plane.create(
-        Point3D.create(0, 0, 0),
-        Vector3D.create(0, 0, 1)))
+        _origin,
+        _pos_z))
     construction_plane = temp_occurrence.component.constructionPlanes.add(construction_plane_input)
     sketch = temp_occurrence.component.sketches.add(construction_plane, temp_occurrence)
 
@@ -737,8 +762,8 @@ class BoundedEntity(object):
 
     def size(self) -> Vector3D:
         """Returns: The size of this entity as a Vector3D."""
-        return self.bounding_box.raw_bounding_box.minPoint.vectorTo(
-            self.bounding_box.raw_bounding_box.maxPoint)
+        bounding_box = self.bounding_box.raw_bounding_box
+        return bounding_box.minPoint.vectorTo(bounding_box.maxPoint)
 
     def min(self) -> Point3D:
         """Returns: The minimum point of this entity's bounding box."""
@@ -750,10 +775,10 @@ class BoundedEntity(object):
 
     def mid(self) -> Point3D:
         """Returns: The geometric midpoint of this entity."""
-        return Point3D.create(
-            (self.bounding_box.raw_bounding_box.minPoint.x + self.bounding_box.raw_bounding_box.maxPoint.x)/2,
-            (self.bounding_box.raw_bounding_box.minPoint.y + self.bounding_box.raw_bounding_box.maxPoint.y)/2,
-            (self.bounding_box.raw_bounding_box.minPoint.z + self.bounding_box.raw_bounding_box.maxPoint.z)/2)
+        bounding_box = self.bounding_box.raw_bounding_box
+        return Point3D.create(*[
+            (min_value + max_value)/2
+            for min_value, max_value in zip(bounding_box.minPoint.asArray(), bounding_box.maxPoint.asArray())])
 
     def __neg__(self) -> Place:
         """Returns: a Place object that represents this entity's negative bound."""
@@ -836,6 +861,8 @@ class Body(BRepEntity):
     def __init__(self, brep_provider: Callable[[], BRepBody], component: 'Component'):
         super().__init__(component)
         self._brep_provider = brep_provider
+        self._cached_edges = {}
+        self._cached_faces = {}
 
     @property
     def brep(self) -> BRepBody:
@@ -845,12 +872,27 @@ class Body(BRepEntity):
     @property
     def edges(self) -> Sequence['Edge']:
         """Returns: All Edges that are a part of this Body, or an empty Sequence if there are None."""
-        return _VirtualSequence(range(0, len(self.brep.edges)), lambda i: Edge(lambda: self.brep.edges[i], self))
+        return _VirtualSequence(range(0, len(self.brep.edges)), self._get_edge)
 
     @property
     def faces(self) -> Sequence['Face']:
         """Returns: All Faces that are a part of this Body, or an empty Sequence if there are None."""
-        return _VirtualSequence(range(0, len(self.brep.faces)), lambda i: Face(lambda: self.brep.faces[i], self))
+        return _VirtualSequence(range(0, len(self.brep.faces)), self._get_face)
+
+    def _get_edge(self, index: int) -> 'Edge':
+        # The wrappers are reused so that their cached bounding boxes survive across repeated lookups of the same edge
+        edge = self._cached_edges.get(index)
+        if edge is None:
+            edge = Edge(lambda: self.brep.edges[index], self)
+            self._cached_edges[index] = edge
+        return edge
+
+    def _get_face(self, index: int) -> 'Face':
+        face = self._cached_faces.get(index)
+        if face is None:
+            face = Face(lambda: self.brep.faces[index], self)
+            self._cached_faces[index] = face
+        return face
 
 
 class Loop(BRepEntity):
@@ -957,15 +999,17 @@ class Face(BRepEntity):
 
     def get_plane(self) -> Optional[adsk.core.Plane]:
         """Returns: The plane that this Face lies in, or None if this is not a planar component."""
-        if isinstance(self.brep.geometry, adsk.core.Plane):
-            if self.brep.isParamReversed:
-                normal = self.brep.geometry.normal.copy()
+        face_brep = self.brep
+        geometry = face_brep.geometry
+        if isinstance(geometry, adsk.core.Plane):
+            if face_brep.isParamReversed:
+                normal = geometry.normal.copy()
                 normal.scaleBy(-1)
                 return adsk.core.Plane.create(
-                    self.brep.geometry.origin,
+                    geometry.origin,
                     normal)
             else:
-                return self.brep.geometry
+                return geometry
         return None
 
     def make_component(self, name="Face") -> 'Component':
@@ -1075,16 +1119,17 @@ class BoundingBox(BoundedEntity):
         Returns: The new Box component.
         """
 
-        if self.size().x == 0:
-            box = Rect(self.size().z, self.size().y, name=name)
+        size_x, size_y, size_z = self.size().asArray()
+        if size_x == 0:
+            box = Rect(size_z, size_y, name=name)
             box.ry(90)
-        elif self.size().y == 0:
-            box = Rect(self.size().x, self.size().z, name=name)
+        elif size_y == 0:
+            box = Rect(size_x, size_z, name=name)
             box.rx(90)
-        elif self.size().z == 0:
-            box = Rect(self.size().x, self.size().y, name=name)
+        elif size_z == 0:
+            box = Rect(size_x, size_y, name=name)
         else:
-            box = Box(*self.size().asArray(), name=name)
+            box = Box(size_x, size_y, size_z, name=name)
 
         box.place(
             ~box == ~self,
@@ -1118,12 +1163,6 @@ class Component(BoundedEntity, ABC):
     to get very slow for even slightly complex objects. Instead, fscad tries to use temporary Brep objects as much as
     possible, which are typically much faster to work with.
     """
-    _origin = Point3D.create(0, 0, 0)
-    _null_vector = Vector3D.create(0, 0, 0)
-    _pos_x = Vector3D.create(1, 0, 0)
-    _pos_y = Vector3D.create(0, 1, 0)
-    _pos_z = Vector3D.create(0, 0, 1)
-
     """The name of the Component.
     
     When this Component is created as an Occurrence in the Fusion 360 Document, this will be used as the name of the
@@ -1137,6 +1176,8 @@ class Component(BoundedEntity, ABC):
         self._local_transform = Matrix3D.create()
         self.name = name
         self._cached_brep_bodies = None
+        self._cached_bodies = None
+        self._cached_union_body = None
         self._cached_world_transform = None
         self._cached_inverse_transform = None
         self._named_points = {}
@@ -1144,7 +1185,16 @@ class Component(BoundedEntity, ABC):
         self._named_faces = {}
 
     def _calculate_bounding_box(self) -> BoundingBox3D:
-        return _get_exact_bounding_box(self.bodies)
+        # Combine the bounding boxes of the individual bodies, so that the (cached) per-body results are shared with
+        # any direct queries of the bodies' bounding boxes.
+        bounding_box = None
+        for body in self.bodies:
+            body_bounding_box = body.bounding_box.raw_bounding_box
+            if bounding_box is None:
+                bounding_box = body_bounding_box
+            else:
+                bounding_box.combine(body_bounding_box)
+        return bounding_box
 
     def _raw_bodies(self) -> Iterable[BRepBody]:
         raise NotImplementedError()
@@ -1165,6 +1215,8 @@ class Component(BoundedEntity, ABC):
         copy._local_transform = self.world_transform()
         copy._cached_bounding_box = None
         copy._cached_brep_bodies = None
+        copy._cached_bodies = None
+        copy._cached_union_body = None
         copy._cached_world_transform = None
         copy._cached_inverse_transform = None
         copy._named_points = dict(self._named_points)
@@ -1215,9 +1267,20 @@ class Component(BoundedEntity, ABC):
     @property
     def bodies(self) -> Sequence[Body]:
         """Returns: All bodies that make up this Component."""
-        return _VirtualSequence(
-            range(0, len(self._get_cached_brep_bodies())),
-            lambda i: Body(lambda: self._get_cached_brep_bodies()[i], self))
+        if self._cached_bodies is None:
+            self._cached_bodies = tuple(
+                Body(lambda index=i: self._get_cached_brep_bodies()[index], self)
+                for i in range(0, len(self._get_cached_brep_bodies())))
+        return self._cached_bodies
+
+    def _union_body(self) -> Optional[BRepBody]:
+        """Returns: A single temporary body that is the union of all bodies in this Component.
+
+        The returned body is cached, and must not be modified.
+        """
+        if self._cached_union_body is None:
+            self._cached_union_body = _union_entities(self.bodies)
+        return self._cached_union_body
 
     def create_occurrence(self, create_children=False, scale=1) -> adsk.fusion.Occurrence:
         """Creates an occurrence of this Component in the root of the document in Fusion 360.
@@ -1259,13 +1322,22 @@ class Component(BoundedEntity, ABC):
         occurrence.isLightBulbOn = not hidden
         if create_children:
             self._create_children(occurrence)
-        for name in self._named_points.keys():
-            construction_point_input = occurrence.component.constructionPoints.createInput()
-            construction_point_input.setByPoint(self.named_point(name).point)
-            construction_point = occurrence.component.constructionPoints.add(construction_point_input)
-            construction_point.name = name
+        self._create_named_points(occurrence)
         return occurrence
 
+    def _create_named_points(self, occurrence: adsk.fusion.Occurrence):
+        if not self._named_points:
+            return
+        world_transform = self.world_transform()
+        construction_points = occurrence.component.constructionPoints
+        for name, point in self._named_points.items():
+            point = point.copy()
+            point.transformBy(world_transform)
+            construction_point_input = construction_points.createInput()
+            construction_point_input.setByPoint(point)
+            construction_point = construction_points.add(construction_point_input)
+            construction_point.name = name
+
     def _create_component(self, parent_component):
         return _create_component(
             parent_component, *self.bodies, name=self.name or self._default_name())
@@ -1336,12 +1408,20 @@ class Component(BoundedEntity, ABC):
         return self
 
     def _reset_cache(self):
+        # All cached state in a descendant is derived from its world transform, and calculating that also caches the
+        # world transform of every ancestor. So if our world transform isn't cached, nothing below us is either, and
+        # we can skip walking the hierarchy. This keeps chained transforms (e.g. tx().ty().tz()) from repeatedly
+        # walking the whole tree.
+        reset_children = self._cached_world_transform is not None
         super()._reset_cache()
         self._cached_brep_bodies = None
+        self._cached_bodies = None
+        self._cached_union_body = None
         self._cached_world_transform = None
         self._cached_inverse_transform = None
-        for component in self.children():
-            component._reset_cache()
+        if reset_children:
+            for component in self.children():
+                component._reset_cache()
 
     def world_transform(self) -> Matrix3D:
         if self._cached_world_transform is not None:
@@ -1391,10 +1471,13 @@ class Component(BoundedEntity, ABC):
                 through this point.
         Returns: `self`
         """
+        if rx == 0 and ry == 0 and rz == 0:
+            return self
+
         transform = self._local_transform
 
         if center is None:
-            center_point = self._origin
+            center_point = _origin
         elif isinstance(center, Point3D):
             center_point = center
         elif isinstance(center, Point):
@@ -1405,17 +1488,15 @@ class Component(BoundedEntity, ABC):
                 center_coordinates.append(0)
             center_point = Point3D.create(*center_coordinates)
 
+        rotation = Matrix3D.create()
         if rx != 0:
-            rotation = Matrix3D.create()
-            rotation.setToRotation(math.radians(rx), self._pos_x, center_point)
+            rotation.setToRotation(math.radians(rx), _pos_x, center_point)
             transform.transformBy(rotation)
         if ry != 0:
-            rotation = Matrix3D.create()
-            rotation.setToRotation(math.radians(ry), self._pos_y, center_point)
+            rotation.setToRotation(math.radians(ry), _pos_y, center_point)
             transform.transformBy(rotation)
         if rz != 0:
-            rotation = Matrix3D.create()
-            rotation.setToRotation(math.radians(rz), self._pos_z, center_point)
+            rotation.setToRotation(math.radians(rz), _pos_z, center_point)
             transform.transformBy(rotation)
         self._reset_cache()
         return self
@@ -1466,6 +1547,9 @@ class Component(BoundedEntity, ABC):
 
         Returns: `self`
         """
+        if tx == 0 and ty == 0 and tz == 0:
+            return self
+
         translation = Matrix3D.create()
         translation.translation = adsk.core.Vector3D.create(tx, ty, tz)
         self._local_transform.transformBy(translation)
@@ -1523,7 +1607,7 @@ class Component(BoundedEntity, ABC):
             raise ValueError("Non-uniform scaling is not currently supported")
 
         if center is None:
-            center_point = self._origin
+            center_point = _origin
         elif isinstance(center, Point3D):
             center_point = center
         elif isinstance(center, Point):
@@ -1749,7 +1833,7 @@ class Component(BoundedEntity, ABC):
         Returns: A tuple of 2 Point3D objects. The first will be a point on this Component, and the second will be
             a point on the other entity.
         """
-        self_body = _union_entities(self.bodies)
+        self_body = self._union_body()
         other_body = _union_entities(entity)
 
         occ1 = _create_component(root(), self_body, name="temp")
@@ -1782,14 +1866,15 @@ class Component(BoundedEntity, ABC):
             ValueError: If the entities do not intersect along the given vector. If this occurs, this Component will
                 remain in its original position.
         """
-        self_body = _union_entities(self.bodies)
+        self_body = self._union_body()
         other_body = _union_entities(entity, vector=vector)
         axis = vector.copy()
         axis.normalize()
         other_axis = _get_arbitrary_perpendicular_unit_vector(vector)
 
-        self_obb = app().measureManager.getOrientedBoundingBox(self_body, axis, other_axis)
-        other_obb = app().measureManager.getOrientedBoundingBox(other_body, axis, other_axis)
+        measure_manager = app().measureManager
+        self_obb = measure_manager.getOrientedBoundingBox(self_body, axis, other_axis)
+        other_obb = measure_manager.getOrientedBoundingBox(other_body, axis, other_axis)
         self_bb = _oriented_bounding_box_to_bounding_box(self_obb)
         other_bb = _oriented_bounding_box_to_bounding_box(other_obb)
 
@@ -1814,27 +1899,29 @@ class Component(BoundedEntity, ABC):
         occ2 = _create_component(root(), other_body, name="temp")
 
         try:
+            occ1_body = occ1.bRepBodies[0]
+            occ2_body = occ2.bRepBodies[0]
+            point_tolerance = app().pointTolerance
+            transform = occ1.transform
+            translation_matrix = Matrix3D.create()
             while True:
-                shortest_distance = app().measureManager.measureMinimumDistance(
-                    occ1.bRepBodies[0], occ2.bRepBodies[0]).value
-                if shortest_distance < app().pointTolerance:
+                shortest_distance = measure_manager.measureMinimumDistance(occ1_body, occ2_body).value
+                if shortest_distance < point_tolerance:
                     break
 
                 translation = axis.copy()
                 translation.scaleBy(shortest_distance)
-                translation_matrix = Matrix3D.create()
                 translation_matrix.translation = translation
-                transform = occ1.transform
                 transform.transformBy(translation_matrix)
                 occ1.transform = transform
 
-                self_obb = app().measureManager.getOrientedBoundingBox(occ1.bRepBodies[0], vector, other_axis)
+                self_obb = measure_manager.getOrientedBoundingBox(occ1_body, vector, other_axis)
                 self_bb = _oriented_bounding_box_to_bounding_box(self_obb)
 
                 if self_bb.minPoint.x > other_bb.maxPoint.x:
                     raise ValueError("The 2 entities do not intersect along the given vector")
 
-            self.translate(*occ1.transform.translation.asArray())
+            self.translate(*transform.translation.asArray())
         finally:
             occ1.deleteMe()
             occ2.deleteMe()
@@ -1849,7 +1936,7 @@ class Component(BoundedEntity, ABC):
 
         Returns: The maximum thickness of the component in the specified axis.
         """
-        self_body = _union_entities(self.bodies)
+        self_body = self._union_body()
 
         axis = axis.copy()
         axis.normalize()
@@ -1874,7 +1961,7 @@ class Component(BoundedEntity, ABC):
             y_axis = y_axis.copy()
             y_axis.normalize()
 
-        self_body = _union_entities(self.bodies)
+        self_body = self._union_body()
         bounding_box = app().measureManager.getOrientedBoundingBox(self_body, x_axis, y_axis)
 
         box = Box(
@@ -1887,9 +1974,9 @@ class Component(BoundedEntity, ABC):
         matrix = Matrix3D.create()
         matrix.setToAlignCoordinateSystems(
             Point3D.create(bounding_box.length / 2, bounding_box.width / 2, bounding_box.height/2),
-            Vector3D.create(1, 0, 0),
-            Vector3D.create(0, 1, 0),
-            Vector3D.create(0, 0, 1),
+            _pos_x,
+            _pos_y,
+            _pos_z,
             bounding_box.centerPoint,
             x_axis,
             y_axis,
@@ -1913,6 +2000,10 @@ class ComponentWithChildren(Component, ABC):
             if func:
                 func(child)
             child._parent = self
+            # _reset_cache relies on the invariant that a descendant never has cached state unless all of its
+            # ancestors do. func may have cached state in the child while it had no parent, so reset it now that it's
+            # attached, to uphold that.
+            child._reset_cache()
             self._children.append(child)
         self._reset_cache()
 
@@ -1927,13 +2018,18 @@ class ComponentWithChildren(Component, ABC):
 
     def find_children(self, name, recursive=True) -> Sequence[Component]:
         result = []
-        for child in self._children:
-            if child.name == name:
-                result.append(child)
-        if recursive:
-            for child in self._children:
-                if isinstance(child, ComponentWithChildren):
-                    result.extend(child.find_children(name, recursive))
+        # Walk the hierarchy with an explicit stack, rather than recursing and building up an intermediate list at
+        # each level. The resulting order is the same as the recursive version: a component's direct matches, followed
+        # by the matches under each of its children in turn.
+        stack = [self]
+        while stack:
+            component = stack.pop()
+            for child in component._children:
+                if child.name == name:
+                    result.append(child)
+            if recursive:
+                stack.extend(
+                    child for child in reversed(component._children) if isinstance(child, ComponentWithChildren))
         return result
 
 
@@ -1970,12 +2066,13 @@ class BRepComponent(Shape):
     def get_plane(self) -> Optional[adsk.core.Plane]:
         plane = None
         for body in self.bodies:
-            for face in body.faces:
-                if not isinstance(face.brep.geometry, adsk.core.Plane):
+            for face in body.brep.faces:
+                geometry = face.geometry
+                if not isinstance(geometry, adsk.core.Plane):
                     return None
                 if plane is None:
-                    plane = face.brep.geometry
-                elif not plane.isCoPlanarTo(face.brep.geometry):
+                    plane = geometry
+                elif not plane.isCoPlanarTo(geometry):
                     return None
         return plane
 
@@ -2008,7 +2105,7 @@ class Box(Shape):
     def __init__(self, x: float, y: float, z: float, name: str = None):
         body = brep().createBox(OrientedBoundingBox3D.create(
             Point3D.create(x/2, y/2, z/2),
-            self._pos_x, self._pos_y,
+            _pos_x, _pos_y,
             x, y, z))
         super().__init__(body, name=name)
 
@@ -2058,10 +2155,10 @@ class Cylinder(Shape):
     def __init__(self, height: float, radius: float, top_radius: float = None, name: str = None):
         if radius == 0:
             # The API doesn't support the bottom radius being 0, so we have to swap the top and bottom points
-            body = brep().createCylinderOrCone(Point3D.create(0, 0, height), top_radius, self._origin, radius)
+            body = brep().createCylinderOrCone(Point3D.create(0, 0, height), top_radius, _origin, radius)
 
         else:
-            body = brep().createCylinderOrCone(self._origin, radius, Point3D.create(0, 0, height),
+            body = brep().createCylinderOrCone(_origin, radius, Point3D.create(0, 0, height),
                                                top_radius if top_radius is not None else radius)
         if radius == 0:
             self._bottom_index = None
@@ -2151,7 +2248,7 @@ class Sphere(Shape):
         name: The name of the component
     """
     def __init__(self, radius: float, name: str = None):
-        super().__init__(brep().createSphere(self._origin, radius), name=name)
+        super().__init__(brep().createSphere(_origin, radius), name=name)
 
     @property
     def surface(self) -> Face:
@@ -2168,7 +2265,7 @@ class Torus(Shape):
         name: The name of the component
     """
     def __init__(self, major_radius: float, minor_radius: float, name: str = None):
-        super().__init__(brep().createTorus(self._origin, Vector3D.create(0, 0, 1), major_radius, minor_radius),
+        super().__init__(brep().createTorus(_origin, _pos_z, major_radius, minor_radius),
                          name=name)
 
     @property
@@ -2189,7 +2286,7 @@ class Rect(PlanarShape):
         # this is a bit faster than creating it from createWireFromCurves -> createFaceFromPlanarWires
         box = brep().createBox(OrientedBoundingBox3D.create(
             Point3D.create(x/2, y/2, -.5),
-            self._pos_x, self._pos_y,
+            _pos_x, _pos_y,
             x, y, 1))
         super().__init__(brep().copy(box.faces[Box._top_index]), name)
 
@@ -2206,7 +2303,7 @@ class Circle(PlanarShape):
     def __init__(self, radius: float, name: str = None):
         # this is a bit faster than creating it from createWireFromCurves -> createFaceFromPlanarWires
         cylinder = brep().createCylinderOrCone(
-            Point3D.create(0, 0, -1), radius, self._origin, radius)
+            Point3D.create(0, 0, -1), radius, _origin, radius)
         super().__init__(brep().copy(cylinder.faces[self._top_index]), name)
 
 
@@ -2391,18 +2488,19 @@ class Combination(ComponentWithChildren, ABC):
         raise NotImplementedError()
 
     def get_plane(self) -> Optional[adsk.core.Plane]:
-        if self._cached_plane_populated:
-            return self._cached_plane
-        raw_plane = self._raw_plane()
-        if raw_plane is None:
-            self._cached_plane = None
+        if not self._cached_plane_populated:
+            raw_plane = self._raw_plane()
+            if raw_plane is None:
+                self._cached_plane = None
+            else:
+                world_transform = self.world_transform()
+                plane = raw_plane.copy()
+                plane.transformBy(world_transform)
+                self._cached_plane = plane
             self._cached_plane_populated = True
-        else:
-            world_transform = self.world_transform()
-            plane = raw_plane.copy()
-            plane.transformBy(world_transform)
-            self._cached_plane = plane
-        return self._cached_plane
+        if self._cached_plane is None:
+            return None
+        return self._cached_plane.copy()
 
 
 class Union(Combination):
@@ -2473,9 +2571,10 @@ class Difference(Combination):
                 self._bodies = [brep().copy(child_body.brep) for child_body in child.bodies]
                 self._plane = child.get_plane()
             else:
+                tool_bodies = [tool_body.brep for tool_body in child.bodies]
                 for target_body in self._bodies:
-                    for tool_body in child.bodies:
-                        brep().booleanOperation(target_body, tool_body.brep,
+                    for tool_body in tool_bodies:
+                        brep().booleanOperation(target_body, tool_body,
                                                 adsk.fusion.BooleanTypes.DifferenceBooleanType)
         self._add_children(components, process_child)
 
@@ -2521,9 +2620,10 @@ class Intersection(Combination):
             if self._bodies is None:
                 self._bodies = [brep().copy(child_body.brep) for child_body in child.bodies]
             else:
+                tool_bodies = [tool_body.brep for tool_body in child.bodies]
                 for target_body in self._bodies:
-                    for tool_body in child.bodies:
-                        brep().booleanOperation(target_body, tool_body.brep,
+                    for tool_body in tool_bodies:
+                        brep().booleanOperation(target_body, tool_body,
                                                 adsk.fusion.BooleanTypes.IntersectionBooleanType)
         self._add_children(components, process_child)
 
@@ -2637,11 +2737,7 @@ class Group(Combination):
         if create_children:
             for child in self._hidden_children:
                 child._create_occurrence(occurrence, hidden=True, create_children=create_children, scale=1)
-        for name in self._named_points.keys():
-            construction_point_input = occurrence.component.constructionPoints.createInput()
-            construction_point_input.setByPoint(self.named_point(name).point)
-            construction_point = occurrence.component.constructionPoints.add(construction_point_input)
-            construction_point.name = name
+        self._create_named_points(occurrence)
         return occurrence
 
     def _create_component(self, parent_component):
@@ -2685,11 +2781,12 @@ class Loft(ComponentWithChildren):
         self._add_children(components, process_child)
 
         occurrence = _create_component(root(), *loft_sections, name="loft_temp")
-        loft_feature_input = occurrence.component.features.loftFeatures.createInput(
-            adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
+        loft_features = occurrence.component.features.loftFeatures
+        loft_feature_input = loft_features.createInput(adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
+        feature_sections = loft_feature_input.loftSections
         for body in occurrence.bRepBodies:
-            loft_feature_input.loftSections.add(body.faces[0])
-        loft_feature = occurrence.component.features.loftFeatures.add(loft_feature_input)
+            feature_sections.add(body.faces[0])
+        loft_feature = loft_features.add(loft_feature_input)
         self._bottom_index = _face_index(loft_feature.startFace)
         self._top_index = _face_index(loft_feature.endFace)
         self._body = brep().copy(loft_feature.bodies[0])
@@ -2759,11 +2856,12 @@ class Revolve(ComponentWithChildren):
                 elif face.component != component:
                     raise ValueError("All faces must be from the same component")
 
-                if face.get_plane() is None:
+                face_plane = face.get_plane()
+                if face_plane is None:
                     raise ValueError("Can't revolve non-planar geometry with Revolve.")
                 if plane is None:
-                    plane = face.get_plane()
-                elif not plane.isCoPlanarTo(face.get_plane()):
+                    plane = face_plane
+                elif not plane.isCoPlanarTo(face_plane):
                     raise ValueError("All faces to revolve must be coplanar.")
                 faces.append(face)
         else:
@@ -2798,15 +2896,15 @@ class Revolve(ComponentWithChildren):
             temp_body = temp_bodies[body_index]
             temp_faces.append(_map_face(face, temp_body))
 
-        revolve_input = temp_occurrence.component.features.revolveFeatures.createInput(
+        revolve_features = temp_occurrence.component.features.revolveFeatures
+        revolve_input = revolve_features.createInput(
             _collection_of(temp_faces),
             axis_value,
             adsk.fusion.FeatureOperations.JoinFeatureOperation)
         revolve_input.setAngleExtent(False, ValueInput.createByReal(math.radians(angle)))
-        temp_occurrence.component.features.revolveFeatures.add(revolve_input)
+        revolve_features.add(revolve_input)
 
-        feature = temp_occurrence.component.features.revolveFeatures[
-            temp_occurrence.component.features.revolveFeatures.count - 1]
+        feature = revolve_features[revolve_features.count - 1]
 
         bodies = []
         for body in feature.bodies:
@@ -2869,11 +2967,12 @@ class Sweep(ComponentWithChildren):
                 elif face.component != component:
                     raise ValueError("All faces must be from the same component")
 
-                if face.get_plane() is None:
+                face_plane = face.get_plane()
+                if face_plane is None:
                     raise ValueError("Can't sweep non-planar geometry with Sweep.")
                 if plane is None:
-                    plane = face.get_plane()
-                elif not plane.isCoPlanarTo(face.get_plane()):
+                    plane = face_plane
+                elif not plane.isCoPlanarTo(face_plane):
                     raise ValueError("All faces to sweep must be coplanar.")
                 faces.append(face)
             components.append(component)
@@ -2895,8 +2994,8 @@ class Sweep(ComponentWithChildren):
 
         construction_plane_input = temp_occurrence.component.constructionPlanes.createInput(temp_occurrence)
         construction_plane_input.setByPlane(adsk.core.Plane.create(
-            Point3D.create(0, 0, 0),
-            Vector3D.create(0, 0, 1)))
+            _origin,
+            _pos_z))
         construction_plane = temp_occurrence.component.constructionPlanes.add(construction_plane_input)
         sketch = temp_occurrence.component.sketches.add(construction_plane, temp_occurrence)
 
@@ -2919,7 +3018,8 @@ class Sweep(ComponentWithChildren):
             _collection_of(edges),
             isChain=False)
 
-        sweep_input = temp_occurrence.component.features.sweepFeatures.createInput(
+        sweep_features = temp_occurrence.component.features.sweepFeatures
+        sweep_input = sweep_features.createInput(
             _collection_of(temp_faces),
             path_object,
             adsk.fusion.FeatureOperations.JoinFeatureOperation)
@@ -2927,7 +3027,7 @@ class Sweep(ComponentWithChildren):
         sweep_input.distanceOne = ValueInput.createByReal(1.0)
         sweep_input.twistAngle = ValueInput.createByReal(turns * math.pi * 2)
 
-        feature = temp_occurrence.component.features.sweepFeatures.add(sweep_input)
+        feature = sweep_features.add(sweep_input)
 
         bodies = []
         for body in feature.bodies:
@@ -2966,15 +3066,15 @@ class ExtrudeBase(ComponentWithChildren):
             temp_body = temp_bodies[body_index]
             temp_faces.append(_map_face(face, temp_body))
 
-        extrude_input = temp_occurrence.component.features.extrudeFeatures.createInput(
+        extrude_features = temp_occurrence.component.features.extrudeFeatures
+        extrude_input = extrude_features.createInput(
             _collection_of(temp_faces), adsk.fusion.FeatureOperations.JoinFeatureOperation)
         extrude_input.setOneSideExtent(
             extent, adsk.fusion.ExtentDirections.PositiveExtentDirection, ValueInput.createByReal(0))
-        temp_occurrence.component.features.extrudeFeatures.add(extrude_input)
+        extrude_features.add(extrude_input)
         # extrudeFeatures.add sometimes returns a feature with the wrong body? wth?
         # Getting it by index seems to work at least.
-        feature = temp_occurrence.component.features.extrudeFeatures[
-            temp_occurrence.component.features.extrudeFeatures.count - 1]
+        feature = extrude_features[extrude_features.count - 1]
 
         bodies = []
         feature_body_map = {}
@@ -2987,26 +3087,18 @@ class ExtrudeBase(ComponentWithChildren):
                 bodies.append(brep().copy(body))
         self._bodies = bodies
 
-        self._start_face_indices = []
-        for face in feature.startFaces:
-            body_index = feature_body_map.get(feature_bodies.index(face.body))
-            # Exclude any faces that come from the input face
-            if body_index is not None:
-                self._start_face_indices.append((body_index, _face_index(face)))
-
-        self._end_face_indices = []
-        for face in feature.endFaces:
-            body_index = feature_body_map.get(feature_bodies.index(face.body))
-            # Exclude any faces that come from the input face
-            if body_index is not None:
-                self._end_face_indices.append((body_index, _face_index(face)))
-
-        self._side_face_indices = []
-        for face in feature.sideFaces:
-            body_index = feature_body_map.get(feature_bodies.index(face.body))
-            # Exclude any faces that come from the input face
-            if body_index is not None:
-                self._side_face_indices.append((body_index, _face_index(face)))
+        def get_face_indices(faces):
+            face_indices = []
+            for face in faces:
+                body_index = feature_body_map.get(feature_bodies.index(face.body))
+                # Exclude any faces that come from the input face
+                if body_index is not None:
+                    face_indices.append((body_index, _face_index(face)))
+            return face_indices
+
+        self._start_face_indices = get_face_indices(feature.startFaces)
+        self._end_face_indices = get_face_indices(feature.endFaces)
+        self._side_face_indices = get_face_indices(feature.sideFaces)
 
         self._add_children([component])
 
@@ -3337,13 +3429,10 @@ class SplitFace(ComponentWithChildren):
         else:
             raise ValueError("Invalid type for splitting tool: %s" % splitting_tool.__class__.__name__)
 
-        split_face_input = temp_occurrence.component.features.splitFaceFeatures.createInput(
+        split_face_features = temp_occurrence.component.features.splitFaceFeatures
+        split_face_input = split_face_features.createInput(
             _collection_of(faces_to_split), _collection_of(splitting_entities), False)
-        temp_occurrence.component.features.splitFaceFeatures.add(split_face_input)
-
-        result_faces = []
-        for body in temp_occurrence.component.bRepBodies:
-            result_faces.extend(body.faces)
+        split_face_features.add(split_face_input)
 
         temp_occurrence_bodies = list(temp_occurrence.component.bRepBodies)
         bodies = []
@@ -3351,17 +3440,17 @@ class SplitFace(ComponentWithChildren):
             bodies.append(brep().copy(body))
         self._bodies = bodies
 
+        # The body and face indices fall out of the iteration order, so there's no need to search for them afterward
         self._split_face_indices = []
-        for face in result_faces:
-            for splitting_entity in splitting_entities:
-                if isinstance(splitting_entity, BRepBody):
-                    if _check_face_intersection(face, splitting_entity):
-                        body_index = temp_occurrence_bodies.index(face.body)
-                        self._split_face_indices.append((body_index, _face_index(face)))
-                else:
-                    if _check_face_coincidence(face, splitting_entity):
-                        body_index = temp_occurrence_bodies.index(face.body)
-                        self._split_face_indices.append((body_index, _face_index(face)))
+        for body_index, body in enumerate(temp_occurrence_bodies):
+            for face_index, face in enumerate(body.faces):
+                for splitting_entity in splitting_entities:
+                    if isinstance(splitting_entity, BRepBody):
+                        if _check_face_intersection(face, splitting_entity):
+                            self._split_face_indices.append((body_index, face_index))
+                    else:
+                        if _check_face_coincidence(face, splitting_entity):
+                            self._split_face_indices.append((body_index, face_index))
 
         temp_occurrence.deleteMe()
         temp_splitting_occurrence.deleteMe()
@@ -3550,8 +3639,9 @@ class Hull(ComponentWithChildren):
             raise ValueError("Input component must be planar")
 
         transform = Matrix3D.create()
-        transform.setToRotateTo(plane.normal, Vector3D.create(0, 0, 1))
+        transform.setToRotateTo(plane.normal, _pos_z)
 
+        point_tolerance = app().pointTolerance
         all_points = []
         for face in component.faces:
             loop_points = []
@@ -3565,12 +3655,12 @@ class Hull(ComponentWithChildren):
                     raise ValueError("Couldn't get curve strokes")
 
                 if loop_points:
-                    if points[0].distanceTo(loop_points[-1]) < app().pointTolerance:
+                    if points[0].distanceTo(loop_points[-1]) < point_tolerance:
                         points = points[1:]
-                    elif points[0].distanceTo(loop_points[0]) < app().pointTolerance:
+                    elif points[0].distanceTo(loop_points[0]) < point_tolerance:
                         loop_points = loop_points[::-1]
                         points = points[1:]
-                    elif points[-1].distanceTo(loop_points[-1]) < app().pointTolerance:
+                    elif points[-1].distanceTo(loop_points[-1]) < point_tolerance:
                         points = points[-2::-1]
                     else:
                         loop_points = loop_points[::-1]
@@ -3580,7 +3670,7 @@ class Hull(ComponentWithChildren):
                     point.transformBy(transform)
                     edge_points.append(point)
                 loop_points.extend(edge_points)
-            assert loop_points[-1].distanceTo(loop_points[0]) < app().pointTolerance
+            assert loop_points[-1].distanceTo(loop_points[0]) < point_tolerance
             del(loop_points[-1])
             all_points.extend(loop_points)
 
@@ -3615,9 +3705,10 @@ class Hull(ComponentWithChildren):
         copy._body = self._body
 
     def get_plane(self) -> Optional[adsk.core.Plane]:
-        if not self.faces:
+        faces = self.faces
+        if not faces:
             return None
-        return self.faces[0].get_plane()
+        return faces[0].get_plane()
 
     @staticmethod
     def _is_left(p0: Point3D, p1: Point3D, p2: Point3D):
@@ -3737,8 +3828,8 @@ class RawThreads(Shape):
 
         helixes = [
             brep().createHelixWire(
-                axisPoint=Point3D.create(0, 0, 0),
-                axisVector=Vector3D.create(0, 0, 1),
+                axisPoint=_origin,
+                axisVector=_pos_z,
                 startPoint=point,
                 pitch=pitch,
                 turns=turns,
@@ -3764,11 +3855,12 @@ class RawThreads(Shape):
 
         temp_occurrence = _create_component(
             root(), *helix_surfaces, start_face_body, end_face_body, name="temp")
-        stitch_input = temp_occurrence.component.features.stitchFeatures.createInput(
+        stitch_features = temp_occurrence.component.features.stitchFeatures
+        stitch_input = stitch_features.createInput(
             _collection_of(temp_occurrence.bRepBodies),
             adsk.core.ValueInput.createByReal(app().pointTolerance),
             adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        temp_occurrence.component.features.stitchFeatures.add(stitch_input)
+        stitch_features.add(stitch_input)
 
         body = brep().copy(temp_occurrence.bRepBodies[0])
         temp_occurrence.deleteMe()
@@ -3777,7 +3869,7 @@ class RawThreads(Shape):
         for index, face in enumerate(body.faces):
             if isinstance(face.geometry, adsk.core.Plane):
                 planar_face_count += 1
-                to_origin_vector = face.pointOnFace.vectorTo(Point3D.create(0, 0, 0))
+                to_origin_vector = face.pointOnFace.vectorTo(_origin)
                 cross = face.geometry.normal.crossProduct(to_origin_vector)
                 if cross.z < 0:
                     self._start_face_index = index
@@ -3956,12 +4048,13 @@ class Threads(ComponentWithChildren):
 
         thread_occurrence = _create_component(root(), *surface_bodies, name="thread")
 
-        stitch_input = thread_occurrence.component.features.stitchFeatures.createInput(
+        stitch_features = thread_occurrence.component.features.stitchFeatures
+        stitch_input = stitch_features.createInput(
             _collection_of(thread_occurrence.bRepBodies),
             adsk.core.ValueInput.createByReal(app().pointTolerance),
             adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
 
-        thread_occurrence.component.features.stitchFeatures.add(stitch_input)
+        stitch_features.add(stitch_input)
         cumulative_body = None
         for body in thread_occurrence.bRepBodies:
             if cumulative_body is None:
@@ -4029,25 +4122,27 @@ class Fillet(ComponentWithChildren):
             elif component != edge.component:
                 raise ValueError("All edges must be in the same component")
 
+        component_bodies = component.bodies
         edge_indices = []
         for edge in edges:
-            body_index = _body_index(edge.body, component.bodies)
+            body_index = _body_index(edge.body, component_bodies)
             if body_index is None:
                 raise ValueError("Couldn't find body in component")
-            edge_index = _edge_index(edge)
-            edge_indices.append((body_index, edge_index))
+            edge_indices.append((body_index, _edge_index(edge)))
 
         occurrence = component.create_occurrence(False)
+        occurrence_bodies = list(occurrence.bRepBodies)
         occurrence_edges = []
-        for edge_index in edge_indices:
-            occurrence_edges.append(occurrence.bRepBodies[edge_index[0]].edges[edge_index[1]])
+        for body_index, edge_index in edge_indices:
+            occurrence_edges.append(occurrence_bodies[body_index].edges[edge_index])
 
-        fillet_input = occurrence.component.features.filletFeatures.createInput()
+        fillet_features = occurrence.component.features.filletFeatures
+        fillet_input = fillet_features.createInput()
         fillet_input.addConstantRadiusEdgeSet(_collection_of(occurrence_edges),
                                               ValueInput.createByReal(radius),
                                               False)
         fillet_input.isRollingBallCorner = not blend_corners
-        occurrence.component.features.filletFeatures.add(fillet_input)
+        fillet_features.add(fillet_input)
 
         self._bodies = [brep().copy(body) for body in occurrence.bRepBodies]
 
@@ -4083,20 +4178,22 @@ class Chamfer(ComponentWithChildren):
             elif component != edge.component:
                 raise ValueError("All edges must be in the same component")
 
+        component_bodies = component.bodies
         edge_indices = []
         for edge in edges:
-            body_index = _body_index(edge.body, component.bodies)
+            body_index = _body_index(edge.body, component_bodies)
             if body_index is None:
                 raise ValueError("Couldn't find body in component")
-            edge_index = _edge_index(edge)
-            edge_indices.append((body_index, edge_index))
+            edge_indices.append((body_index, _edge_index(edge)))
 
         occurrence = component.create_occurrence(False)
+        occurrence_bodies = list(occurrence.bRepBodies)
         occurrence_edges = []
-        for edge_index in edge_indices:
-            occurrence_edges.append(occurrence.bRepBodies[edge_index[0]].edges[edge_index[1]])
+        for body_index, edge_index in edge_indices:
+            occurrence_edges.append(occurrence_bodies[body_index].edges[edge_index])
 
-        chamfer_input = occurrence.component.features.chamferFeatures.createInput(
+        chamfer_features = occurrence.component.features.chamferFeatures
+        chamfer_input = chamfer_features.createInput(
             _collection_of(occurrence_edges), False)
         if distance2 is not None:
             chamfer_input.setToTwoDistances(
@@ -4106,7 +4203,7 @@ class Chamfer(ComponentWithChildren):
             chamfer_input.setToEqualDistance(
                 ValueInput.createByReal(distance))
 
-        feature = occurrence.component.features.chamferFeatures.add(chamfer_input)
+        feature = chamfer_features.add(chamfer_input)
 
         feature_bodies = list(feature.bodies)
 
@@ -4165,7 +4262,7 @@ class Scale(ComponentWithChildren):
         super().__init__(name)
 
         if center is None:
-            center = Point3D.create(0, 0, 0)
+            center = _origin
         elif isinstance(center, Point):
             center = center.point
         elif isinstance(center, Tuple):
@@ -4173,17 +4270,20 @@ class Scale(ComponentWithChildren):
 
         occurrence = component.create_occurrence(False)
         try:
-            construction_point_input = occurrence.component.constructionPoints.createInput(occurrence)
+            occurrence_component = occurrence.component
+            construction_points = occurrence_component.constructionPoints
+            construction_point_input = construction_points.createInput(occurrence)
             construction_point_input.setByPoint(center)
-            center_point = occurrence.component.constructionPoints.add(construction_point_input)
+            center_point = construction_points.add(construction_point_input)
 
-            scale_input = occurrence.component.features.scaleFeatures.createInput(_collection_of(occurrence.bRepBodies),
-                                                                                  center_point,
-                                                                                  ValueInput.createByReal(1))
+            scale_features = occurrence_component.features.scaleFeatures
+            scale_input = scale_features.createInput(_collection_of(occurrence.bRepBodies),
+                                                     center_point,
+                                                     ValueInput.createByReal(1))
             scale_input.setToNonUniform(ValueInput.createByReal(sx),
                                         ValueInput.createByReal(sy),
                                         ValueInput.createByReal(sz))
-            occurrence.component.features.scaleFeatures.add(scale_input)
+            scale_features.add(scale_input)
 
             self._bodies = [brep().copy(body) for body in occurrence.bRepBodies]
             self._add_children([component])
@@ -4280,14 +4380,15 @@ class Thicken(ComponentWithChildren):
         temp_occurrence.activate()
         result_bodies = []
 
-        thicken_input = temp_occurrence.component.features.thickenFeatures.createInput(
+        thicken_features = temp_occurrence.component.features.thickenFeatures
+        thicken_input = thicken_features.createInput(
             _collection_of(temp_faces),
             ValueInput.createByReal(thickness),
             False,
             adsk.fusion.FeatureOperations.JoinFeatureOperation,
             False)
 
-        feature = temp_occurrence.component.features.thickenFeatures.add(thicken_input)
+        feature = thicken_features.add(thicken_input)
 
         feature_bodies = list(feature.bodies)
         # In some cases, the face being extruded is included in the bodies for some reason. If so, we want to
@@ -4350,6 +4451,15 @@ class MemoizableDesign(object):
     class MemoizeComponent(object):
         def __init__(self, func):
             self._func = func
+            self._signature = inspect.signature(func)
+
+        @staticmethod
+        def _make_key(val):
+            # noinspection PyBroadException
+            try:
+                return hash(val)
+            except:
+                return id(val)
 
         # noinspection PyProtectedMember
         def __call__(self, *args, **kwargs):
@@ -4361,18 +4471,10 @@ class MemoizableDesign(object):
                 func_cache = {}
                 memoizable_instance._MemoizableDesign__memoize_cache[self._func] = func_cache
 
-            def make_key(val):
-                # noinspection PyBroadException
-                try:
-                    return hash(val)
-                except:
-                    return id(val)
-
-            sig = inspect.signature(self._func)
-            bound_args = sig.bind(*args, **kwargs)
+            bound_args = self._signature.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
-            key = tuple((item[0], make_key(item[1]))
+            key = tuple((item[0], self._make_key(item[1]))
                    for item in tuple(bound_args.arguments.items())[1:] if item[0] != "name")
 
             try:
@@ -4409,6 +4511,10 @@ def setup_document(document_name="fSCAD-Preview"):
         document_name: The name of the document to create. If a document of the given name already exists, it will
             be forcibly closed and recreated.
     """
+    # This switches the active document, so the cached design can't be used while it runs
+    refresh_design_cache = _design is not None
+    _cache_active_design(None)
+
     preview_doc = None
     saved_camera = None
     saved_units = None
@@ -4434,6 +4540,8 @@ def setup_document(document_name="fSCAD-Preview"):
     if saved_units is not None:
         design().fusionUnitsManager.distanceDisplayUnits = saved_units
     design().designType = adsk.fusion.DesignTypes.DirectDesignType
+    if refresh_design_cache:
+        _cache_active_design(design())
 
 
 def run_design(design_func, message_box_on_error=True, print_runtime=True, document_name=None,
@@ -4464,6 +4572,7 @@ def run_design(design_func, message_box_on_error=True, print_runtime=True, docum
             filename = module.__file__
             document_name = pathlib.Path(filename).stem
         setup_document(document_name)
+        _cache_active_design(design())
         design_func(*(design_args or ()), **(design_kwargs or {}))
         end = time.time()
         if print_runtime:
@@ -4472,6 +4581,8 @@ def run_design(design_func, message_box_on_error=True, print_runtime=True, docum
         print(traceback.format_exc())
         if message_box_on_error:
             ui().messageBox('Failed:\n{}'.format(traceback.format_exc()))
+    finally:
+        _cache_active_design(None)
 
 
 def run(_):
@@ -4484,8 +4595,8 @@ def run(_):
     fscad.__path__ = [os.path.dirname(os.path.realpath(__file__))]
     sys.modules['fscad.fscad'] = fscad
 
-    for key in __all__:
-        fscad.__setattr__(key, globals()[key])
+    module_globals = globals()
+    vars(fscad).update({key: module_globals[key] for key in __all__})
 
 
 def relative_import(path):
@@ -4524,6 +4635,9 @@ def relative_import(path):
 
 def stop(_):
     """Callback from Fusion 360 for when this script is being stopped."""
+    global _app
+    _app = None
+    _cache_active_design(None)
     if "fscad.fscad" in sys.modules:
         del sys.modules["fscad.fscad"]
 
@@ -35,6 +35,19 @@ class BodyTest(FscadTestCase):
 
         self.assertEqual(body.mid().asArray(), (1.5, .5, .5))
 
+    def test_face_after_translate(self):
+        box = Box(1, 1, 1)
+        top = box.top
+
+        self.assertEqual(top.mid().asArray(), (.5, .5, 1))
+        self.assertEqual(box.top.mid().asArray(), (.5, .5, 1))
+
+        box.tx(1)
+
+        self.assertEqual(top.mid().asArray(), (1.5, .5, 1))
+        self.assertEqual(box.top.mid().asArray(), (1.5, .5, 1))
+        self.assertEqual(box.mid().asArray(), (1.5, .5, .5))
+
 
 def run(context):
     import sys
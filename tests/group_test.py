@@ -24,7 +24,9 @@ from fscad.fscad import *
 class GroupTest(FscadTestCase):
     def validate_test(self):
         if self._test_name in ("components",
-                               "named_faces_on_children"):
+                               "named_faces_on_children",
+                               "chained_transforms",
+                               "find_children_nested"):
             return
         super().validate_test()
 
@@ -123,6 +125,38 @@ class GroupTest(FscadTestCase):
         for edge in group.edges:
             self.assertEqual(edge.component, group)
 
+    def test_chained_transforms(self):
+        box1 = Box(1, 1, 1, name="box1")
+        box2 = Box(1, 1, 1, name="box2")
+        box2.tx(2)
+        group = Group([box1, box2])
+
+        group_box2 = group.find_children("box2")[0]
+        self.assertEqual(group_box2.mid().asArray(), (2.5, .5, .5))
+
+        group.tx(1).ty(1).tz(1)
+        self.assertEqual(group_box2.mid().asArray(), (3.5, 1.5, 1.5))
+
+        group.tx(1)
+        group.tx(1)
+        self.assertEqual(group_box2.mid().asArray(), (5.5, 1.5, 1.5))
+
+    def test_find_children_nested(self):
+        inner_box = Box(1, 1, 1, name="box")
+        inner_group = Group([inner_box], name="inner")
+        outer_box = Box(1, 1, 1, name="box")
+        outer_box.tx(2)
+        outer_group = Group([inner_group, outer_box], name="outer")
+
+        found = outer_group.find_children("box")
+        self.assertEqual(len(found), 2)
+        self.assertIs(found[0], outer_box)
+        self.assertIs(found[1], inner_box)
+
+        found = outer_group.find_children("box", recursive=False)
+        self.assertEqual(len(found), 1)
+        self.assertIs(found[0], outer_box)
+
     def test_named_faces_on_children(self):
         box1 = Box(1, 1, 1, name="box1")
         box2 = Box(1, 1, 1, name="box2")
@@ -130,6 +130,21 @@ class MiscTest(FscadTestCase):
         self.assertEqual(box2.bodies[0].brep.pointContainment(point2),
                          adsk.fusion.PointContainment.PointOnPointContainment)
 
+    def test_closest_points_after_translate(self):
+        box1 = Box(1, 1, 1, name="box1")
+        box2 = Box(1, 1, 1, name="box2")
+        box2.place(~box2 == ~box1,
+                   (-box2 == +box1) + 2,
+                   -box2 == -box1)
+
+        (point1, point2) = box1.closest_points(box2)
+        self.assertEqual(point1.distanceTo(point2), 2)
+
+        box1.ty(1)
+
+        (point1, point2) = box1.closest_points(box2)
+        self.assertEqual(point1.distanceTo(point2), 1)
+
     def test_thickness_box(self):
         box = Box(1, 1, 1)
 